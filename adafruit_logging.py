@@ -60,7 +60,17 @@ Attributes
 import time
 import sys
 import os
-from collections import namedtuple
+
+# Local bindings of the time functions used on the per-record path; a
+# module global is cheaper to load than an attribute of the time module
+_monotonic = time.monotonic
+_localtime = time.localtime
+
+try:
+    import traceback as _traceback
+except ImportError:
+    # Not available on all boards
+    _traceback = None
 
 try:
     # pylint: disable=deprecated-class
@@ -115,37 +125,100 @@ LEVELS = [
 for __value, __name in LEVELS:
     globals()[__name] = __value
 
+_LEVEL_NAMES = dict(LEVELS)
+"""Mapping of numeric level to level name, for O(1) lookup of the
+standard levels on every log record."""
+
+# The standard level names in severity order, for bucketing values that
+# fall between the standard levels
+_LEVEL_NAMES_SEQ = tuple(name for _, name in LEVELS)
+
+_LEVEL_PREFIX = {value: ": " + name + " - " for value, name in LEVELS}
+"""Precomputed ``": NAME - "`` fragment of the default message prefix for
+each standard level, so building a prefix needs no concatenation."""
+
 
 def _level_for(value: int) -> str:
     """Convert a numeric level to the most appropriate name.
 
     :param int value: a numeric level
     """
-    for i, level in enumerate(LEVELS):
-        if value == level[0]:
-            return level[1]
-        if value < level[0]:
-            return LEVELS[i - 1][1]
-    return LEVELS[0][1]
-
-
-LogRecord = namedtuple(
-    "_LogRecord", ("name", "levelno", "levelname", "msg", "created", "args")
-)
-"""An object used to hold the contents of a log record.  The following attributes can
-be retrieved from it:
-
-- ``name`` - The name of the logger
-- ``levelno`` - The log level number
-- ``levelname`` - The log level name
-- ``msg`` - The log message
-- ``created`` - When the log record was created
-- ``args`` - The additional positional arguments provided
-"""
-
+    name = _LEVEL_NAMES.get(value)
+    if name is not None:
+        return name
+    # The standard levels are multiples of 10, so an in-between value
+    # buckets to the level below it with one integer division
+    name = _LEVEL_NAMES_SEQ[min(max(value, 0) // 10, 5)]
+    # Memoize so each distinct non-standard value is resolved only once
+    _LEVEL_NAMES[value] = name
+    return name
+
+
+class LogRecord:
+    """An object used to hold the contents of a log record.  The following attributes can
+    be retrieved from it:
+
+    - ``name`` - The name of the logger
+    - ``levelno`` - The log level number
+    - ``levelname`` - The log level name, resolved from ``levelno`` the
+      first time it is read
+    - ``msg`` - The log message, with any positional arguments
+      interpolated the first time it is read
+    - ``created`` - When the log record was created
+    - ``args`` - The additional positional arguments provided
+    """
 
-def _logRecordFactory(name, level, msg, args):
-    return LogRecord(name, level, _level_for(level), msg, time.monotonic(), args)
+    # A __slots__ class is smaller and quicker to construct than the
+    # namedtuple previously used here, which matters because one record
+    # is created for every emitted message
+    __slots__ = (
+        "name",
+        "levelno",
+        "_levelname",
+        "_msg",
+        "created",
+        "args",
+        "_rendered",
+    )
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        name: Hashable,
+        levelno: int,
+        levelname: Optional[str],
+        msg: str,
+        created: float,
+        args: tuple,
+    ) -> None:
+        self.name = name
+        self.levelno = levelno
+        self._levelname = levelname
+        self._msg = msg
+        self.created = created
+        self.args = args
+        self._rendered = not args
+
+    @property
+    def levelname(self) -> str:
+        """The name of the record's level, computed from ``levelno`` on
+        first access so handlers that never read it don't pay for the
+        lookup."""
+        name = self._levelname
+        if name is None:
+            name = _level_for(self.levelno)
+            self._levelname = name
+        return name
+
+    @property
+    def msg(self) -> str:
+        """The rendered log message; interpolating the positional
+        arguments is deferred until the message is first read, and the
+        result is kept so multiple handlers share one rendering."""
+        if not self._rendered:
+            self._msg = self._msg % self.args
+            self._rendered = True
+        return self._msg
 
 
 class Formatter:
@@ -161,6 +234,11 @@ class Formatter:
 
     The only two styles currently supported are '%' and '{'. The default
     style is '{'
+
+    Setting ``use_monotonic`` renders ``asctime`` as the record's
+    monotonic timestamp in seconds instead of a wall-clock date; useful
+    on boards without an RTC, where `time.localtime` is both meaningless
+    and comparatively expensive.
     """
 
     def __init__(  # pylint: disable=too-many-arguments
@@ -170,6 +248,7 @@ class Formatter:
         style: str = "%",
         validate: bool = True,
         defaults: Dict = None,
+        use_monotonic: bool = False,
     ):
         self.fmt = fmt
         self.datefmt = datefmt
@@ -181,6 +260,15 @@ class Formatter:
 
         self.validate = validate
         self.defaults = defaults
+        self.use_monotonic = use_monotonic
+        # Everything knowable from the template is decided here, once,
+        # rather than per record in format()
+        self._use_percent = self.style == "%"
+        self._uses_asctime = self.fmt is not None and (
+            "{asctime}" in self.fmt or "%(asctime)s" in self.fmt
+        )
+        self._asctime_key = None
+        self._asctime = None
 
     def format(self, record: LogRecord) -> str:
         """
@@ -197,42 +285,63 @@ class Formatter:
             "created": record.created,
             "args": record.args,
         }
-        if "{asctime}" in self.fmt or "%(asctime)s" in self.fmt:
-            now = time.localtime()
-            # pylint: disable=line-too-long
-            vals[
-                "asctime"
-            ] = f"{now.tm_year}-{now.tm_mon:02d}-{now.tm_mday:02d} {now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
+        if self._uses_asctime and self.use_monotonic:
+            # The record already carries a monotonic timestamp; no
+            # localtime call needed
+            vals["asctime"] = f"{record.created:.3f}"
+        elif self._uses_asctime:
+            now = _localtime()
+            # Records logged within the same second share the formatted
+            # timestamp instead of rebuilding it
+            if now != self._asctime_key:
+                self._asctime_key = now
+                # pylint: disable=line-too-long
+                self._asctime = f"{now.tm_year}-{now.tm_mon:02d}-{now.tm_mday:02d} {now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
+            vals["asctime"] = self._asctime
 
         if self.defaults:
             for key, val in self.defaults.items():
                 if key not in vals:
                     vals[key] = val
 
-        if self.style not in ("{", "%"):
-            raise ValueError(
-                "Only '%' and '{' formatting style are supported at this time."
-            )
-
-        if self.style == "%":
+        if self._use_percent:
             return self.fmt % vals
 
         return self.fmt.format(**vals)
 
 
+_config_generation = 0
+"""Incremented whenever a handler's level changes, so that loggers know
+to refresh their cached effective threshold."""
+
+_NO_SINK = 1 << 30
+"""Threshold above any realistic level, for loggers whose handlers all
+discard their records, so no record is ever built for them."""
+
+
 class Handler:
     """Base logging message handler."""
 
+    _is_null = False
+    """Whether this handler discards every record it is given; loggers
+    skip building records that only such handlers would accept."""
+
     def __init__(self, level: int = NOTSET) -> None:
         """Create Handler instance"""
         self.level = level
         self.formatter = None
+        self._last_prefix_key = None
+        self._last_prefix = None
 
     def setLevel(self, level: int) -> None:
         """
-        Set the logging level of this handler.
+        Set the logging level of this handler.  Prefer this over assigning
+        ``level`` directly so that loggers the handler is attached to can
+        refresh their cached thresholds.
         """
+        global _config_generation  # pylint: disable=global-statement
         self.level = level
+        _config_generation += 1
 
     # pylint: disable=no-self-use
     def format(self, record: LogRecord) -> str:
@@ -242,7 +351,16 @@ class Handler:
         """
         if self.formatter:
             return self.formatter.format(record)
-        return f"{record.created:<0.3f}: {record.levelname} - {record.msg}"
+        # Bursts of records sharing a timestamp and level (common with a
+        # coarse monotonic clock) reuse the previously built prefix
+        key = (record.created, record.levelno)
+        if key != self._last_prefix_key:
+            self._last_prefix_key = key
+            suffix = _LEVEL_PREFIX.get(record.levelno)
+            if suffix is None:
+                suffix = ": " + record.levelname + " - "
+            self._last_prefix = f"{record.created:<0.3f}" + suffix
+        return self._last_prefix + record.msg
 
     def emit(self, record: LogRecord) -> None:
         """Send a message where it should go.
@@ -253,6 +371,16 @@ class Handler:
 
         raise NotImplementedError()
 
+    def emit_many(self, records: list) -> None:
+        """Send a batch of messages where they should go.  The base
+        implementation emits them one at a time; handlers whose sinks
+        benefit from fewer, larger writes can override this.
+
+        :param list records: The records (message objects) to be logged
+        """
+        for record in records:
+            self.emit(record)
+
     def flush(self) -> None:
         """Placeholder for flush function in subclasses."""
 
@@ -283,12 +411,18 @@ class StreamHandler(Handler):
         """The stream to log to"""
 
     def format(self, record: LogRecord) -> str:
-        """Generate a string to log
+        """Generate a string to log, including the line terminator, so
+        that `emit` can write it in one go without another concatenation
 
         :param record: The record (message object) to be logged
         """
         text = super().format(record)
+        # The overwhelmingly common single-line message skips the
+        # splitlines/join allocations entirely
+        if "\n" not in text:
+            return text + self.terminator
         lines = text.splitlines()
+        lines.append("")
         return self.terminator.join(lines)
 
     def emit(self, record: LogRecord) -> None:
@@ -296,7 +430,7 @@ class StreamHandler(Handler):
 
         :param record: The record (message object) to be logged
         """
-        self.stream.write(self.format(record) + self.terminator)
+        self.stream.write(self.format(record))
 
     def flush(self) -> None:
         """flush the stream. You might need to call this if your messages
@@ -309,30 +443,81 @@ class FileHandler(StreamHandler):
     """File handler for working with log files off of the microcontroller (like
     an SD card)
 
+    By default every record is written and flushed immediately, which on
+    storage such as SD cards costs a filesystem commit per message.  A
+    non-zero ``buffer_size`` instead collects roughly that many characters
+    in RAM and writes them in one go (or on `flush`/`close`); buffered
+    messages are lost if the board resets before they are flushed.
+
     :param str filename: The filename of the log file
     :param str mode: Whether to write ('w') or append ('a'); default is to append
+    :param int buffer_size: If non-zero, how many characters to collect
+        before writing to the file; default is to write each record
+        immediately
     """
 
     terminator = "\r\n"
 
-    def __init__(self, filename: str, mode: str = "a") -> None:
+    def __init__(self, filename: str, mode: str = "a", buffer_size: int = 0) -> None:
         # pylint: disable=consider-using-with
         if mode == "r":
             raise ValueError("Can't write to a read only file")
         super().__init__(open(filename, mode=mode))
+        self._buffer_size = buffer_size
+        self._buffer = []
+        self._buffer_len = 0
 
     def close(self) -> None:
-        """Closes the file"""
-        self.stream.flush()
+        """Closes the file, flushing any buffered messages first"""
+        self.flush()
         self.stream.close()
 
+    def flush(self) -> None:
+        """Write any buffered messages and flush the underlying stream."""
+        if self._buffer:
+            self.stream.write("".join(self._buffer))
+            self._buffer = []
+            self._buffer_len = 0
+        self.stream.flush()
+
     def emit(self, record: LogRecord) -> None:
         """Generate the message and write it to the file.
 
         :param record: The record (message object) to be logged
         """
-        super().emit(record)
-        self.stream.flush()
+        if self._buffer_size <= 0:
+            super().emit(record)
+            self.stream.flush()
+            return
+        text = self.format(record)
+        self._buffer.append(text)
+        self._buffer_len += len(text)
+        # Errors write through so they reach the file before a possible crash
+        if self._buffer_len >= self._buffer_size or record.levelno >= ERROR:
+            self.flush()
+
+    def emit_many(self, records: list) -> None:
+        """Generate the messages and write them to the file in a single
+        write call.
+
+        :param list records: The records (message objects) to be logged
+        """
+        worst = NOTSET
+        parts = []
+        for record in records:
+            parts.append(self.format(record))
+            if record.levelno > worst:
+                worst = record.levelno
+        text = "".join(parts)
+        if self._buffer_size <= 0:
+            self.stream.write(text)
+            self.stream.flush()
+            return
+        self._buffer.append(text)
+        self._buffer_len += len(text)
+        # Same write-through policy as emit: error batches flush immediately
+        if self._buffer_len >= self._buffer_size or worst >= ERROR:
+            self.flush()
 
 
 class RotatingFileHandler(FileHandler):
@@ -355,14 +540,21 @@ class RotatingFileHandler(FileHandler):
     :param str mode: Whether to write ('w') or append ('a'); default is to append
     :param int maxBytes: The max allowable size of the log file in bytes.
     :param int backupCount: The number of old log files to keep.
+    :param int buffer_size: If non-zero, how many characters to collect
+        before writing to the file, as with `FileHandler`; messages at
+        ERROR and above are always written through immediately.  Any
+        buffered messages are written to the old file before it is
+        rotated.
     """
 
+    # pylint: disable=too-many-arguments
     def __init__(
         self,
         filename: str,
         mode: str = "a",
         maxBytes: int = 0,
         backupCount: int = 0,
+        buffer_size: int = 0,
     ) -> None:
         if maxBytes < 0:
             raise ValueError("maxBytes must be a positive number")
@@ -375,7 +567,14 @@ class RotatingFileHandler(FileHandler):
         self._backupCount = backupCount
 
         # Open the file and save the handle to self.stream
-        super().__init__(self._LogFileName, mode=self._WriteMode)
+        super().__init__(
+            self._LogFileName, mode=self._WriteMode, buffer_size=buffer_size
+        )
+
+        # Track the file size ourselves so deciding whether to roll over
+        # doesn't cost a flush plus a stat per record; the file exists at
+        # this point since the open above created it if needed
+        self._bytesWritten = os.stat(self._LogFileName)[6]
 
     def doRollover(self) -> None:
         """Roll over the log files. This should not need to be called directly"""
@@ -383,34 +582,41 @@ class RotatingFileHandler(FileHandler):
         # Close the log file. Probably needed if we want to delete/rename files.
         self.close()
 
+        # One directory listing tells us which generations exist, so the
+        # missing ones (every slot, on the first rollovers) are skipped
+        # with a set test instead of a raised-and-caught OSError each
+        dirname, _, basename = self._LogFileName.rpartition("/")
+        existing = set(os.listdir(dirname if dirname else "."))
+
         for i in range(self._backupCount, 0, -1):
             CurrentFileName = self._LogFileName + "." + str(i)
-            CurrentFileNamePlus = self._LogFileName + "." + str(i + 1)
-            try:
-                if i == self._backupCount:
-                    # This is the oldest log file. Delete this one.
-                    os.remove(CurrentFileName)
-                else:
-                    # Rename the current file to the next number in the sequence.
-                    os.rename(CurrentFileName, CurrentFileNamePlus)
-            except OSError as e:
-                if e.args[0] == 2:
-                    # File does not exsist. This is okay.
-                    pass
-                else:
-                    raise e
+            if basename + "." + str(i) not in existing:
+                # File does not exsist. This is okay.
+                continue
+            if i == self._backupCount:
+                # This is the oldest log file. Delete this one.
+                os.remove(CurrentFileName)
+            else:
+                # Rename the current file to the next number in the sequence.
+                os.rename(CurrentFileName, self._LogFileName + "." + str(i + 1))
 
         # Rename the current log to the first backup
-        os.rename(self._LogFileName, CurrentFileName)
+        os.rename(self._LogFileName, self._LogFileName + ".1")
 
         # Reopen the file.
         # pylint: disable=consider-using-with
         self.stream = open(self._LogFileName, mode=self._WriteMode)
+        self._bytesWritten = 0
 
     def GetLogSize(self) -> int:
-        """Check the size of the log file."""
+        """Check the on-disk size of the log file.
+
+        This is a diagnostic helper only; rotation uses the running byte
+        counter instead.  Pending output (including any write buffer) is
+        not counted until it reaches the filesystem, so call `flush`
+        first if the exact current size matters.
+        """
         try:
-            self.stream.flush()  # We need to call this or the file size is always zero.
             LogFileSize = os.stat(self._LogFileName)[6]
         except OSError as e:
             if e.args[0] == 2:
@@ -421,17 +627,39 @@ class RotatingFileHandler(FileHandler):
         return LogFileSize
 
     def emit(self, record: LogRecord) -> None:
-        """Generate the message and write it to the file.
+        """Generate the message and write it to the file, rolling the
+        log files first if this message would push the file over the
+        size limit.
 
         :param record: The record (message object) to be logged
         """
+        text = self.format(record)
         if (
-            (self.GetLogSize() >= self._maxBytes)
-            and (self._maxBytes > 0)
-            and (self._backupCount > 0)
+            self._maxBytes > 0
+            and self._backupCount > 0
+            and self._bytesWritten + len(text) >= self._maxBytes
         ):
+            # doRollover closes the file, which drains any buffered
+            # messages into it before the rename
             self.doRollover()
-        super().emit(record)
+        if self._buffer_size <= 0:
+            self.stream.write(text)
+            self.stream.flush()
+        else:
+            self._buffer.append(text)
+            self._buffer_len += len(text)
+            if self._buffer_len >= self._buffer_size or record.levelno >= ERROR:
+                self.flush()
+        self._bytesWritten += len(text)
+
+    def emit_many(self, records: list) -> None:
+        """Write a batch of records, checking for rollover as each one
+        is written.
+
+        :param list records: The records (message objects) to be logged
+        """
+        for record in records:
+            self.emit(record)
 
 
 class NullHandler(Handler):
@@ -441,6 +669,8 @@ class NullHandler(Handler):
     logging.
     """
 
+    _is_null = True
+
     def emit(self, record: LogRecord) -> None:
         """Dummy implementation"""
 
@@ -449,13 +679,6 @@ logger_cache = {}
 _default_handler = StreamHandler()
 
 
-def _addLogger(logger_name: Hashable) -> None:
-    """Adds the logger if it doesn't already exist"""
-    if logger_name not in logger_cache:
-        new_logger = Logger(logger_name)
-        logger_cache[logger_name] = new_logger
-
-
 def getLogger(logger_name: Hashable = "") -> "Logger":
     """Create or retrieve a logger by name; only retrieves loggers
     made using this function; if a Logger with this name does not
@@ -466,8 +689,11 @@ def getLogger(logger_name: Hashable = "") -> "Logger":
         be created/retrieved.  Note that unlike CPython, a blank string will also
         access the root logger.
     """
-    _addLogger(logger_name)
-    return logger_cache[logger_name]
+    logger = logger_cache.get(logger_name)
+    if logger is None:
+        logger = Logger(logger_name)
+        logger_cache[logger_name] = logger
+    return logger
 
 
 class Logger:
@@ -485,7 +711,41 @@ class Logger:
         """The name of the logger, this should be unique for proper
         functionality of `getLogger()`"""
         self._handlers = []
+        self._emitters = []
         self.emittedNoHandlerWarning = False
+        self._floor = level
+        self._floor_gen = -1
+
+    def _refreshFloor(self) -> None:
+        """Recompute the cached lowest level at which any attached sink
+        (or the default handler as fallback) could emit a record."""
+        floor = self._level
+        handlers = self._handlers
+        sink = None
+        claimed = None
+        for handler in handlers:
+            level = handler.level
+            if claimed is None or level < claimed:
+                claimed = level
+            # pylint: disable=protected-access
+            if not handler._is_null and (sink is None or level < sink):
+                sink = level
+        # The default handler only sees records no attached handler claims
+        if _default_handler is not None and (
+            claimed is None or _default_handler.level < claimed
+        ):
+            if sink is None or _default_handler.level < sink:
+                sink = _default_handler.level
+        if sink is None:
+            if handlers:
+                # Only null sinks: no record can ever produce output
+                floor = _NO_SINK
+            # Otherwise keep the logger's own level so handle() can issue
+            # its one-time missing-handler warning
+        elif sink > floor:
+            floor = sink
+        self._floor = floor
+        self._floor_gen = _config_generation
 
     def setLevel(self, log_level: int) -> None:
         """Set the logging cutoff level.
@@ -494,6 +754,7 @@ class Logger:
         """
 
         self._level = log_level
+        self._floor_gen = -1
 
     def getEffectiveLevel(self) -> int:
         """Get the effective level for this logger.
@@ -509,6 +770,10 @@ class Logger:
         :param Handler hdlr: The handler to add
         """
         self._handlers.append(hdlr)
+        # Bind emit once here instead of per record in handle(); method
+        # binding allocates on MicroPython
+        self._emitters.append((hdlr, hdlr.emit))
+        self._floor_gen = -1
 
     def removeHandler(self, hdlr: Handler) -> None:
         """Remove handler from this logger.
@@ -516,14 +781,33 @@ class Logger:
         :param Handler hdlr: The handler to remove
         """
         self._handlers.remove(hdlr)
+        for index, (handler, _) in enumerate(self._emitters):
+            if handler is hdlr:
+                del self._emitters[index]
+                break
+        self._floor_gen = -1
 
     def hasHandlers(self) -> bool:
         """Whether any handlers have been set for this logger"""
         return len(self._handlers) > 0
 
-    def _log(self, level: int, msg: str, *args) -> None:
-        record = _logRecordFactory(
-            self.name, level, (msg % args) if args else msg, args
+    def _log(self, level: int, msg: str, args: tuple = ()) -> None:
+        # Check the effective threshold first so that suppressed messages
+        # never pay for string interpolation or record construction; the
+        # threshold folds in the registered handler levels (and the default
+        # handler's) so a message no sink would accept is one compare
+        if self._floor_gen != _config_generation:
+            self._refreshFloor()
+        if level < self._floor:
+            return
+        record = LogRecord(
+            self.name,
+            level,
+            # Resolved lazily by the record on first levelname access
+            None,
+            msg,
+            _monotonic(),
+            args,
         )
         self.handle(record)
 
@@ -532,30 +816,71 @@ class Logger:
 
         :param LogRecord record: log record
         """
-        if (
-            _default_handler is None
-            and not self.hasHandlers()
-            and not self.emittedNoHandlerWarning
-        ):
-            sys.stderr.write(
-                f"Logger '{self.name}' has no handlers and default handler is None\n"
-            )
-            self.emittedNoHandlerWarning = True
+        # Hoist the per-record attribute and global reads out of the loop
+        lvl = record.levelno
+        handlers = self._handlers
+        default_handler = _default_handler
+        # The no-sink warning can only apply when there are no handlers at
+        # all, so the usual configured path pays one truthiness check here
+        if not handlers and default_handler is None:
+            if not self.emittedNoHandlerWarning:
+                sys.stderr.write(
+                    f"Logger '{self.name}' has no handlers and default handler is None\n"
+                )
+                self.emittedNoHandlerWarning = True
             return
 
         emitted = False
-        if record.levelno >= self._level:
-            for handler in self._handlers:
-                if record.levelno >= handler.level:
-                    handler.emit(record)
+        if lvl >= self._level:
+            # The emit methods were bound once at addHandler time; the
+            # level is read live so handler.setLevel keeps working
+            for handler, emit in self._emitters:
+                if lvl >= handler.level:
+                    emit(record)
                     emitted = True
 
-            if (
-                not emitted
-                and _default_handler
-                and record.levelno >= _default_handler.level
-            ):
-                _default_handler.emit(record)
+            if not emitted and default_handler and lvl >= default_handler.level:
+                default_handler.emit(record)
+
+    def handle_many(self, records: list) -> None:
+        """Pass a batch of records to all handlers registered with this
+        logger.  Each handler receives the records it accepts in a single
+        `Handler.emit_many` call, so handlers backed by slow sinks (such
+        as `FileHandler`) can coalesce their writes.  The default handler
+        is only used if no registered handler accepted any of the records.
+
+        :param list records: the log records, in the order they should
+            be emitted
+        """
+        handlers = self._handlers
+        if not handlers and _default_handler is None:
+            if not self.emittedNoHandlerWarning:
+                sys.stderr.write(
+                    f"Logger '{self.name}' has no handlers and default handler is None\n"
+                )
+                self.emittedNoHandlerWarning = True
+            return
+
+        level = self._level
+        emitted = False
+        for handler in handlers:
+            accepted = [
+                record
+                for record in records
+                if record.levelno >= level and record.levelno >= handler.level
+            ]
+            if accepted:
+                handler.emit_many(accepted)
+                emitted = True
+
+        if not emitted and _default_handler:
+            accepted = [
+                record
+                for record in records
+                if record.levelno >= level and record.levelno >= _default_handler.level
+            ]
+            if accepted:
+                _default_handler.emit_many(accepted)
 
     def log(self, level: int, msg: str, *args) -> None:
         """Log a message.
@@ -567,7 +892,31 @@ class Logger:
             can be empty
         """
 
-        self._log(level, msg, *args)
+        if level < self._level:
+            return
+        self._log(level, msg, args)
+
+    def logMany(self, level: int, messages: list) -> None:
+        """Log a batch of messages at the same priority level.
+
+        All records in the batch share one timestamp and are handed to
+        each handler in a single `Handler.emit_many` call, so handlers
+        backed by slow sinks (such as `FileHandler`) can coalesce their
+        writes.
+
+        :param int level: the priority level at which to log
+        :param list messages: the message strings, in the order they
+            should be emitted; formatting directives are not supported
+        """
+        if self._floor_gen != _config_generation:
+            self._refreshFloor()
+        if level < self._floor or not messages:
+            return
+        created = _monotonic()
+        name = self.name
+        self.handle_many(
+            [LogRecord(name, level, None, msg, created, ()) for msg in messages]
+        )
 
     def debug(self, msg: str, *args) -> None:
         """Log a debug message.
@@ -577,7 +926,9 @@ class Logger:
         :param args: arguments to ``msg % args``;
             can be empty
         """
-        self._log(DEBUG, msg, *args)
+        if self._level > DEBUG:
+            return
+        self._log(DEBUG, msg, args)
 
     def info(self, msg: str, *args) -> None:
         """Log a info message.
@@ -588,7 +939,9 @@ class Logger:
             can be empty
         """
 
-        self._log(INFO, msg, *args)
+        if self._level > INFO:
+            return
+        self._log(INFO, msg, args)
 
     def warning(self, msg: str, *args) -> None:
         """Log a warning message.
@@ -599,7 +952,9 @@ class Logger:
             can be empty
         """
 
-        self._log(WARNING, msg, *args)
+        if self._level > WARNING:
+            return
+        self._log(WARNING, msg, args)
 
     def error(self, msg: str, *args) -> None:
         """Log a error message.
@@ -610,7 +965,9 @@ class Logger:
             can be empty
         """
 
-        self._log(ERROR, msg, *args)
+        if self._level > ERROR:
+            return
+        self._log(ERROR, msg, args)
 
     def critical(self, msg: str, *args) -> None:
         """Log a critical message.
@@ -620,7 +977,9 @@ class Logger:
         :param args: arguments to ``msg % args``;
             can be empty
         """
-        self._log(CRITICAL, msg, *args)
+        if self._level > CRITICAL:
+            return
+        self._log(CRITICAL, msg, args)
 
     # pylint: disable=no-value-for-parameter; value and tb are optional for traceback
     def exception(self, err: Exception) -> None:
@@ -628,20 +987,14 @@ class Logger:
 
         :param Exception err: the exception to be logged
         """
-        try:
-            # pylint: disable=import-outside-toplevel; not available on all boards
-            import traceback
-        except ImportError:
+        if _traceback is None:
             self._log(
                 ERROR,
                 "%s: %s (No traceback on this board)",
-                err.__class__.__name__,
-                str(err),
+                (err.__class__.__name__, str(err)),
             )
-        else:
-            lines = [str(err)] + traceback.format_exception(err)
-            lines = str(err) + "".join(lines)
-            # some of the returned strings from format_exception already have newlines in them,
-            # so we can't add the indent in the above line - needs to be done separately
-            lines = lines.replace("\n", "\n  ")
-            self._log(ERROR, lines)
+            return
+        text = str(err) + "\n" + "".join(_traceback.format_exception(err))
+        # some of the returned strings from format_exception already have newlines in them,
+        # so we can't add the indent in the above line - needs to be done separately
+        self._log(ERROR, text.replace("\n", "\n  "))
@@ -23,14 +23,39 @@ class MQTTHandler(Handler):
     Log handler that emits log records as MQTT PUBLISH messages.
     """
 
-    def __init__(self, mqtt_client: MQTT.MQTT, topic: str) -> None:
+    MAX_BUFFERED_BATCHES = 4
+    """How many batches' worth of messages to retain while the broker is
+    unreachable; older messages are dropped beyond this."""
+
+    def __init__(
+        self,
+        mqtt_client: MQTT.MQTT,
+        topic: str,
+        buffer_size: int = 0,
+        max_payload: int = 0,
+    ) -> None:
         """
         Assumes that the MQTT client object is already connected.
+
+        With the default ``buffer_size`` of 0 every record is published
+        immediately. A positive ``buffer_size`` collects that many
+        messages and publishes them as one newline-joined payload,
+        amortizing the broker round-trip across the batch. While the
+        broker is unreachable at most `MAX_BUFFERED_BATCHES` batches of
+        messages are retained, oldest dropped first.
+
+        A positive ``max_payload`` truncates each message to that many
+        characters before it is buffered or published, keeping payloads
+        below fragmentation limits on constrained links and bounding
+        the memory the buffer can hold.
         """
         super().__init__()
 
         self._mqtt_client = mqtt_client
         self._topic = topic
+        self._buffer_size = buffer_size
+        self._buffer = []
+        self._max_payload = max_payload
 
         # To make it work also in CPython.
         self.level = NOTSET
@@ -39,9 +64,55 @@ class MQTTHandler(Handler):
         """
         Publish message from the LogRecord to the MQTT broker, if connected.
         """
+        msg = record.msg
+        if 0 < self._max_payload < len(msg):
+            msg = msg[: self._max_payload]
+        if self._buffer_size > 0:
+            self._buffer.append(msg)
+            if len(self._buffer) >= self._buffer_size:
+                self.flush()
+            # If the broker stays unreachable, flush() keeps the buffer;
+            # shed the oldest lines past a few batches' worth so a long
+            # outage loses log lines instead of exhausting the heap.
+            overflow = len(self._buffer) - self.MAX_BUFFERED_BATCHES * self._buffer_size
+            if overflow > 0:
+                del self._buffer[:overflow]
+            return
+        try:
+            if self._mqtt_client.is_connected():
+                self._mqtt_client.publish(self._topic, msg)
+        except MQTT.MMQTTException:
+            pass
+
+    def flush(self) -> None:
+        """
+        Publish any buffered messages as a single newline-joined payload.
+        """
+        if not self._buffer:
+            return
         try:
             if self._mqtt_client.is_connected():
-                self._mqtt_client.publish(self._topic, record.msg)
+                self._mqtt_client.publish(self._topic, "\n".join(self._buffer))
+                self._buffer.clear()
+        except MQTT.MMQTTException:
+            pass
+
+    def pump(self, max_messages: int = 1) -> None:
+        """
+        Publish up to ``max_messages`` buffered messages, one per publish.
+
+        CircuitPython has no background threads to drain a log queue, so
+        call this from the main loop instead: with a generous
+        ``buffer_size`` and regular ``pump()`` calls, ``emit`` never
+        blocks the logging call site on network I/O.
+        """
+        try:
+            while self._buffer and max_messages > 0:
+                if not self._mqtt_client.is_connected():
+                    return
+                self._mqtt_client.publish(self._topic, self._buffer[0])
+                self._buffer.pop(0)
+                max_messages -= 1
         except MQTT.MMQTTException:
             pass
 